@@ -5,27 +5,98 @@ import traceback
 from datetime import datetime
 from dateutil.parser import parse as parse_date
 import time
-import requests
+import asyncio
+import httpx
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 import csv
 import pandas as pd
 import trafilatura
 import os
 
+MAX_WORKERS = 16  # Concurrent article downloads
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Search results to crawl; Yahoo renders the result anchors server-side
+SEARCH_URL = "https://search.yahoo.com/search;_ylt=AwrFOZBwqpVo.SYEvwvQtDMD;_ylu=Y29sbwNiZjEEcG9zAzEEdnRpZAMEc2VjA3BpdnM-?p=NFL+Fantasy+Best+Picks+2025&fr2=piv-web&fr=yfp-t-s"
+SEARCH_MAX_PAGES = 15
+RESULT_LINK_SELECTOR = "div a.d-ib.va-top.mt-38.mb-4.mxw-100p"
+
+# Shared HTTP/2 client so TLS handshakes are paid once per host, not once per article
+CLIENT = httpx.Client(
+    http2=True,
+    timeout=10,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=32),
+    headers={'User-Agent': USER_AGENT}
+)
+
+# Video/social platforms to exclude, matched case-insensitively in one regex pass
+VIDEO_PLATFORMS = (
+    'youtube.com', 'youtu.be', 'tiktok.com', 't.co', 'twitter.com',
+    'instagram.com', 'facebook.com', 'twitch.tv', 'vimeo.com',
+    'dailymotion.com', 'reddit.com', 'pinterest.com', 'snapchat.com',
+    'linkedin.com', 'tumblr.com', 'discord.com', 'telegram.org',
+    'whatsapp.com', 'signal.org', 'wechat.com', 'line.me',
+    'kakao.com', 'naver.com', 'qq.com', 'weibo.com'
+)
+_VIDEO_RE = re.compile('|'.join(map(re.escape, VIDEO_PLATFORMS)), re.IGNORECASE)
+
+# Whitespace collapse used when cleaning extracted text
+_WS_RE = re.compile(r'\s+')
+
+# BeautifulSoup fallback selectors, in priority order where order matters
+_TITLE_SELECTORS = (
+    'h1',
+    'title',
+    '[property="og:title"]',
+    '[name="twitter:title"]'
+)
+
+# Boilerplate to strip before extracting text; joined so one select() finds them all
+_UNWANTED_SELECTOR = ', '.join((
+    'script', 'style', 'nav', 'header', 'footer', 'aside',
+    '.nav', '.header', '.footer', '.sidebar', '.advertisement',
+    '.menu', '.navigation', '.social', '.share', '.comments',
+    '[class*="nav"]', '[class*="menu"]', '[class*="ad"]',
+    '[class*="social"]', '[class*="share"]', '[class*="comment"]'
+))
+
+# Priority selectors for article content
+_CONTENT_SELECTORS = (
+    'article',
+    'main',
+    '.content',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.story-content',
+    '.article-body',
+    '.post-body',
+    '[role="main"]'
+)
+
+_DATE_SELECTORS = (
+    '[property="article:published_time"]',
+    '[name="publish_date"]',
+    '[name="date"]',
+    '.publish-date',
+    '.date',
+    'time',
+    '[class*="date"]',
+    '[class*="time"]'
+)
+
 def extract_article_info(url):
     """Extract article information using Trafilatura with BeautifulSoup fallback"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = CLIENT.get(url)
         response.raise_for_status()
         
-        # Try Trafilatura first
+        # Try Trafilatura first, reusing the page we already downloaded
         try:
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded is not None:
+            downloaded = response.text
+            if downloaded:
                 # Extract text content using Trafilatura
                 text = trafilatura.extract(downloaded, include_formatting=False, include_links=False, include_images=False)
                 
@@ -36,7 +107,7 @@ def extract_article_info(url):
                 
                 # Clean up text
                 if text:
-                    text = re.sub(r'\s+', ' ', text).strip()
+                    text = _WS_RE.sub(' ', text).strip()
                 else:
                     text = "No text found"
                 
@@ -49,19 +120,12 @@ def extract_article_info(url):
         except Exception as trafilatura_error:
             print(f"Trafilatura failed for {url}: {str(trafilatura_error)}")
         
-        # Fallback to BeautifulSoup if Trafilatura fails
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Fallback to BeautifulSoup if Trafilatura fails (lxml's C parser, much faster than html.parser)
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Extract title
         title = ""
-        title_selectors = [
-            'h1',
-            'title',
-            '[property="og:title"]',
-            '[name="twitter:title"]'
-        ]
-        
-        for selector in title_selectors:
+        for selector in _TITLE_SELECTORS:
             title_elem = soup.select_one(selector)
             if title_elem:
                 if selector == 'title':
@@ -75,35 +139,14 @@ def extract_article_info(url):
         text = ""
         
         # Remove unwanted elements
-        unwanted_selectors = [
-            'script', 'style', 'nav', 'header', 'footer', 'aside',
-            '.nav', '.header', '.footer', '.sidebar', '.advertisement',
-            '.menu', '.navigation', '.social', '.share', '.comments',
-            '[class*="nav"]', '[class*="menu"]', '[class*="ad"]',
-            '[class*="social"]', '[class*="share"]', '[class*="comment"]'
-        ]
-        
-        for selector in unwanted_selectors:
-            for elem in soup.select(selector):
+        for elem in soup.select(_UNWANTED_SELECTOR):
+            # Nested matches are already gone once their ancestor is decomposed
+            if not elem.decomposed:
                 elem.decompose()
         
-        # Priority selectors for article content
-        content_selectors = [
-            'article',
-            'main',
-            '.content',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.story-content',
-            '.article-body',
-            '.post-body',
-            '[role="main"]'
-        ]
-        
         # Try to find main content area
         main_content = None
-        for selector in content_selectors:
+        for selector in _CONTENT_SELECTORS:
             main_content = soup.select_one(selector)
             if main_content:
                 break
@@ -132,22 +175,11 @@ def extract_article_info(url):
             text = ' '.join(text_parts)
         
         # Clean up text
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         # Extract publish date
         publish_date = ""
-        date_selectors = [
-            '[property="article:published_time"]',
-            '[name="publish_date"]',
-            '[name="date"]',
-            '.publish-date',
-            '.date',
-            'time',
-            '[class*="date"]',
-            '[class*="time"]'
-        ]
-        
-        for selector in date_selectors:
+        for selector in _DATE_SELECTORS:
             date_elem = soup.select_one(selector)
             if date_elem:
                 date_attr = date_elem.get('content') or date_elem.get('datetime') or date_elem.get_text()
@@ -170,195 +202,238 @@ def extract_article_info(url):
             'url': url
         }
 
-def scrape_ufc_sentiment():
-    try:
-        articles = []
+def scrape_search_links_with_browser(url=SEARCH_URL, max_pages=SEARCH_MAX_PAGES):
+    """Crawl the search results in Playwright, clicking through pagination (slow fallback path)"""
+    articles = []
+    
+    with sync_playwright() as p:
+        # Launch browser with headless=False to show the browser
+        browser = p.chromium.launch(headless=True, slow_mo=1000)
+        context = browser.new_context()
+        page = context.new_page()
+
+        print(f"Navigating to: {url}")
+        
+        page.goto(url)
         
-        with sync_playwright() as p:
-            # Launch browser with headless=False to show the browser
-            browser = p.chromium.launch(headless=True, slow_mo=1000)
-            context = browser.new_context()
-            page = context.new_page()
+        # Wait for the page to load
+        page.wait_for_load_state('networkidle')
+        # Add a small delay to ensure dynamic content loads
+        time.sleep(2)
+        print("Browser is now open. Press Ctrl+C to close it.")
 
-            url = "https://search.yahoo.com/search;_ylt=AwrFOZBwqpVo.SYEvwvQtDMD;_ylu=Y29sbwNiZjEEcG9zAzEEdnRpZAMEc2VjA3BpdnM-?p=NFL+Fantasy+Best+Picks+2025&fr2=piv-web&fr=yfp-t-s"
-            print(f"Navigating to: {url}")
-            
-            page.goto(url)
+        # Loop through all possible pages
+        current_page = 1
+        while current_page <= max_pages:
+            print(f"Scraping page {current_page}...")
             
             # Wait for the page to load
             page.wait_for_load_state('networkidle')
-            # Add a small delay to ensure dynamic content loads
-            time.sleep(2)
-            print("Browser is now open. Press Ctrl+C to close it.")
+            time.sleep(3)  # Increased wait time for better page loading
 
-            # Loop through all possible pages
-            current_page = 1
-            max_pages = 15  # Capped at 50 pages
-            while current_page <= max_pages:
-                print(f"Scraping page {current_page}...")
-                
-                # Wait for the page to load
-                page.wait_for_load_state('networkidle')
-                time.sleep(3)  # Increased wait time for better page loading
+            # Get article links from current page
+            anchors = page.query_selector_all(RESULT_LINK_SELECTOR)
+            links = [a.get_attribute("href") for a in anchors]
 
-                # Get article links from current page
-                anchors = page.query_selector_all("div a.d-ib.va-top.mt-38.mb-4.mxw-100p")
-                links = [a.get_attribute("href") for a in anchors]
+            print(f"Found {len(links)} articles on page {current_page}")
+            
+            # If no links found, we might be at the end
+            if len(links) == 0:
+                print(f"No articles found on page {current_page}. Stopping.")
+                break
+            
+            counter = 1
+            for link in links:
+                print(f"Link {counter}: {link}")
+                counter += 1
+                articles.append(link)
 
-                print(f"Found {len(links)} articles on page {current_page}")
-                
-                # If no links found, we might be at the end
-                if len(links) == 0:
-                    print(f"No articles found on page {current_page}. Stopping.")
-                    break
+            # Try to find the next page link with multiple strategies
+            next_page_found = False
+            try:
+                # Strategy 1: Look for pagination div with next page number
+                pagination_div = page.query_selector("div.pages")
+                if pagination_div:
+                    # Look for next page link by number
+                    next_page_link = pagination_div.query_selector(f"a[title*='{current_page + 1}']")
+                    if next_page_link:
+                        print(f"Clicking on page {current_page + 1}...")
+                        next_page_link.click()
+                        current_page += 1
+                        next_page_found = True
+                        time.sleep(3)  # Wait for page to load
                 
-                counter = 1
-                for link in links:
-                    print(f"Link {counter}: {link}")
-                    counter += 1
-                    articles.append(link)
-
-                # Try to find the next page link with multiple strategies
-                next_page_found = False
-                try:
-                    # Strategy 1: Look for pagination div with next page number
-                    pagination_div = page.query_selector("div.pages")
-                    if pagination_div:
-                        # Look for next page link by number
-                        next_page_link = pagination_div.query_selector(f"a[title*='{current_page + 1}']")
-                        if next_page_link:
-                            print(f"Clicking on page {current_page + 1}...")
-                            next_page_link.click()
+                # Strategy 2: Look for "Next" link if first strategy failed
+                if not next_page_found:
+                    next_links = page.query_selector_all("a")
+                    for link in next_links:
+                        link_text = link.inner_text().strip().lower()
+                        if link_text in ['next', 'next page', '>', '»']:
+                            print(f"Clicking on Next link...")
+                            link.click()
                             current_page += 1
                             next_page_found = True
-                            time.sleep(3)  # Wait for page to load
-                    
-                    # Strategy 2: Look for "Next" link if first strategy failed
-                    if not next_page_found:
-                        next_links = page.query_selector_all("a")
-                        for link in next_links:
-                            link_text = link.inner_text().strip().lower()
-                            if link_text in ['next', 'next page', '>', '»']:
-                                print(f"Clicking on Next link...")
-                                link.click()
+                            time.sleep(3)
+                            break
+                
+                # Strategy 3: Look for pagination by URL pattern
+                if not next_page_found:
+                    current_url = page.url
+                    if 'b=' in current_url:
+                        # Extract current page number from URL
+                        try:
+                            import re
+                            match = re.search(r'b=(\d+)', current_url)
+                            if match:
+                                current_b = int(match.group(1))
+                                next_b = current_b + 10  # Yahoo typically increments by 10
+                                next_url = current_url.replace(f'b={current_b}', f'b={next_b}')
+                                print(f"Navigating to next page via URL: {next_url}")
+                                page.goto(next_url)
                                 current_page += 1
                                 next_page_found = True
                                 time.sleep(3)
-                                break
-                    
-                    # Strategy 3: Look for pagination by URL pattern
-                    if not next_page_found:
-                        current_url = page.url
-                        if 'b=' in current_url:
-                            # Extract current page number from URL
-                            try:
-                                import re
-                                match = re.search(r'b=(\d+)', current_url)
-                                if match:
-                                    current_b = int(match.group(1))
-                                    next_b = current_b + 10  # Yahoo typically increments by 10
-                                    next_url = current_url.replace(f'b={current_b}', f'b={next_b}')
-                                    print(f"Navigating to next page via URL: {next_url}")
-                                    page.goto(next_url)
-                                    current_page += 1
-                                    next_page_found = True
-                                    time.sleep(3)
-                            except:
-                                pass
+                        except:
+                            pass
+                
+                # If no next page found, we're done
+                if not next_page_found:
+                    print(f"No more pages found. Stopping at page {current_page}")
+                    break
                     
-                    # If no next page found, we're done
-                    if not next_page_found:
-                        print(f"No more pages found. Stopping at page {current_page}")
-                        break
-                        
-                except Exception as e:
-                    print(f"Error navigating to next page: {e}")
-                    # Try one more time with a longer wait
-                    try:
-                        time.sleep(5)
-                        page.reload()
-                        time.sleep(3)
-                    except:
-                        print("Failed to reload page. Stopping.")
-                        break
+            except Exception as e:
+                print(f"Error navigating to next page: {e}")
+                # Try one more time with a longer wait
+                try:
+                    time.sleep(5)
+                    page.reload()
+                    time.sleep(3)
+                except:
+                    print("Failed to reload page. Stopping.")
+                    break
 
-            print(f"Total articles scraped: {len(articles)}")
-            browser.close()
+        browser.close()
+    
+    return articles
+
+async def fetch_search_pages(url, max_pages):
+    """Request every results page at once; Yahoo paginates server-side via the b= offset"""
+    page_urls = [f"{url}&b={1 + 10 * i}" for i in range(max_pages)]
+    async with httpx.AsyncClient(http2=True, timeout=10, follow_redirects=True, headers={'User-Agent': USER_AGENT}) as client:
+        return await asyncio.gather(*(client.get(page_url) for page_url in page_urls), return_exceptions=True)
+
+def scrape_search_links(url=SEARCH_URL, max_pages=SEARCH_MAX_PAGES):
+    """
+    Collect article links from the search results pages with parallel HTTP requests.
+    Returns None when the responses look blocked so the caller can fall back to the browser.
+    """
+    print(f"Fetching {max_pages} search result pages from: {url}")
+    pages = asyncio.run(fetch_search_pages(url, max_pages))
+    
+    articles = []
+    for page_number, response in enumerate(pages, 1):
+        if isinstance(response, Exception) or response.status_code != 200:
+            status = response if isinstance(response, Exception) else f"HTTP {response.status_code}"
+            print(f"Search page {page_number} failed ({status})")
+            links = []
+        else:
+            soup = BeautifulSoup(response.content, 'lxml')
+            links = [a.get('href') for a in soup.select(RESULT_LINK_SELECTOR) if a.get('href')]
+            print(f"Found {len(links)} articles on page {page_number}")
+        
+        # If no links found, we might be at the end
+        if len(links) == 0:
+            # Nothing on the first page means bot-blocking or a different markup, not the end
+            if page_number == 1:
+                return None
+            print(f"No articles found on page {page_number}. Stopping.")
+            break
+        
+        for counter, link in enumerate(links, 1):
+            print(f"Link {counter}: {link}")
+            articles.append(link)
+    
+    return articles
+
+def scrape_ufc_sentiment():
+    try:
+        articles = scrape_search_links()
+        if articles is None:
+            print("Search pages blocked or empty over HTTP, falling back to Playwright...")
+            articles = scrape_search_links_with_browser()
+        
+        print(f"Total articles scraped: {len(articles)}")
             
         # Extract article information
         print("\nExtracting article information...")
-        article_data = []
-        
-        # Video platforms to exclude
-        video_platforms = [
-            'youtube.com', 'youtu.be', 'tiktok.com', 't.co', 'twitter.com',
-            'instagram.com', 'facebook.com', 'twitch.tv', 'vimeo.com',
-            'dailymotion.com', 'reddit.com', 'pinterest.com', 'snapchat.com',
-            'linkedin.com', 'tumblr.com', 'discord.com', 'telegram.org',
-            'whatsapp.com', 'signal.org', 'wechat.com', 'line.me',
-            'kakao.com', 'naver.com', 'qq.com', 'weibo.com'
-        ]
+        saved_count = 0
         
-        for i, article_url in enumerate(articles, 1):
-            try:
-                print(f"Processing article {i}/{len(articles)}: {article_url}")
-                
-                # Skip video platforms
-                if any(platform in article_url.lower() for platform in video_platforms):
-                    print(f"Skipping video platform: {article_url}")
-                    continue
-                
-                # Extract article information
-                article_info = extract_article_info(article_url)
-                
-                # Skip articles with HTTP errors
-                if "Error: 403" in article_info['title'] or "Error: 404" in article_info['title'] or "Error:" in article_info['title']:
-                    print(f"Skipping article with HTTP error: {article_url}")
-                    continue
-                
-                # Skip articles with "No text found"
-                if article_info['text'] == "No text found":
-                    print(f"Skipping article with no text: {article_url}")
-                    continue
-                
-                # Add all articles without filtering
-                article_data.append(article_info)
-                print(f"Successfully processed: {article_info['title'][:50]}...")
-                
-            except Exception as e:
-                print(f"Error processing article {i}: {e}")
-                # Add error entry to keep track of failed URLs
-                article_data.append({
-                    'title': f"Error processing: {str(e)}",
-                    'text': f"Error processing: {str(e)}",
-                    'publish_date': "No date found",
-                    'url': article_url
-                })
+        # Skip video platforms
+        article_urls = []
+        for article_url in articles:
+            if _VIDEO_RE.search(article_url):
+                print(f"Skipping video platform: {article_url}")
                 continue
+            article_urls.append(article_url)
         
-        # Save to CSV file
+        # Save to CSV file as articles complete, so a crash keeps everything written so far
         # Create a clean filename based on the search topic
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         csv_dir = "Data"
         os.makedirs(csv_dir, exist_ok=True)
         csv_filename = f"{csv_dir}/sentiment_articles_{timestamp}.csv"
 
-        print(f"\nSaving {len(article_data)} articles to {csv_filename}...")
+        print(f"\nStreaming articles to {csv_filename}...")
 
         with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['title', 'text', 'publish_date', 'url']
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
             writer.writeheader()
-            for article in article_data:
-                writer.writerow(article)
+            
+            # Download and extract articles concurrently; network waits overlap across workers
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {executor.submit(extract_article_info, article_url): article_url for article_url in article_urls}
+                
+                for i, future in enumerate(as_completed(futures), 1):
+                    article_url = futures[future]
+                    try:
+                        print(f"Processing article {i}/{len(futures)}: {article_url}")
+                        
+                        # Extract article information
+                        article_info = future.result()
+                        
+                        # Skip articles with HTTP errors
+                        if "Error: 403" in article_info['title'] or "Error: 404" in article_info['title'] or "Error:" in article_info['title']:
+                            print(f"Skipping article with HTTP error: {article_url}")
+                            continue
+                        
+                        # Skip articles with "No text found"
+                        if article_info['text'] == "No text found":
+                            print(f"Skipping article with no text: {article_url}")
+                            continue
+                        
+                        # Add all articles without filtering
+                        writer.writerow(article_info)
+                        print(f"Successfully processed: {article_info['title'][:50]}...")
+                        
+                    except Exception as e:
+                        print(f"Error processing article {i}: {e}")
+                        # Add error entry to keep track of failed URLs
+                        writer.writerow({
+                            'title': f"Error processing: {str(e)}",
+                            'text': f"Error processing: {str(e)}",
+                            'publish_date': "No date found",
+                            'url': article_url
+                        })
+                    
+                    saved_count += 1
+                    csvfile.flush()
 
-        print(f"Successfully saved {len(article_data)} articles to {csv_filename}")
+        print(f"Successfully saved {saved_count} articles to {csv_filename}")
         
-        # Create a pandas DataFrame for easy analysis
-        df = pd.DataFrame(article_data)
-        print(f"\nDataFrame created with shape: {df.shape}")
-        print("First few rows:")
+        # Preview the saved file with pandas for easy analysis
+        df = pd.read_csv(csv_filename, nrows=5)
+        print("\nFirst few rows:")
         print(df.head())
             
     except Exception as e:
@@ -0,0 +1,145 @@
+"""
+Read and write the saved LangChain document files shared by load-sentiment.py and NFL-Rag.py.
+Documents are stored as zstd-compressed msgpack (*.msgpack.zst); the pickles committed under
+Data/ are still readable.
+"""
+
+import os
+import mmap
+import pickle
+import msgpack
+import zstandard as zstd
+from langchain_core.documents import Document
+
+# Saved document formats, newest first; .pkl is the original export
+DOC_FILE_EXTENSIONS = (".msgpack.zst", ".pkl")
+# Metadata keys set on every Document, in the order they are written positionally to disk
+METADATA_FIELDS = ('title', 'url', 'publish_date', 'source', 'index')
+ZSTD_LEVEL = 3  # Compression level for .msgpack.zst files; low levels write faster than disk
+MSGPACK_FORMAT_VERSION = 3  # Leading byte of the msgpack stream; 3 = one record per document plus a shared string table
+
+def write_documents_msgpack(documents, file_path):
+    """
+    Stream documents to a .msgpack.zst file as a version byte followed by one msgpack record
+    per document, so peak memory is a single encoded document rather than the whole file.
+
+    String metadata values (title, url, source) repeat across every chunk of an article, so
+    each unique string is written once, in the record that first uses it, and later records
+    refer to it by its position in that running string table. Metadata with exactly the
+    METADATA_FIELDS keys is written as a list of values, without the key names.
+
+    Records go to a .tmp file that only replaces file_path once the last one is written, so an
+    interrupted save never leaves a truncated file behind under the real name.
+
+    Args:
+        documents (Iterable[Document]): LangChain Document objects
+        file_path (str): Destination .msgpack.zst path
+
+    Returns:
+        int: Number of documents written
+    """
+    packer = msgpack.Packer(use_bin_type=True)
+    string_ids = {}
+    count = 0
+    tmp_path = file_path + '.tmp'
+    try:
+        with zstd.open(tmp_path, 'wb', cctx=zstd.ZstdCompressor(level=ZSTD_LEVEL)) as f:
+            f.write(bytes([MSGPACK_FORMAT_VERSION]))
+            for doc in documents:
+                # Metadata with the standard keys is stored as a plain list, in METADATA_FIELDS order
+                positional = tuple(doc.metadata) == METADATA_FIELDS
+                new_strings = []
+                refs = []
+                values = []
+                for position, (key, value) in enumerate(doc.metadata.items()):
+                    if isinstance(value, str):
+                        string_id = string_ids.get(value)
+                        if string_id is None:
+                            string_id = string_ids[value] = len(string_ids)
+                            new_strings.append(value)
+                        refs.append(position if positional else key)
+                        value = string_id
+                    values.append(value)
+                metadata = values if positional else dict(zip(doc.metadata, values))
+                f.write(packer.pack([new_strings, doc.page_content, metadata, refs]))
+                count += 1
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Includes KeyboardInterrupt; the with block above would otherwise end the stream cleanly
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+def iter_documents_msgpack(file_path):
+    """
+    Lazily yield LangChain documents from a file written by write_documents_msgpack.
+
+    Args:
+        file_path (str): Path to the saved .msgpack.zst file
+
+    Yields:
+        Document: One LangChain Document per stored record
+    """
+    with zstd.open(file_path, 'rb') as f:
+        version = f.read(1)
+        if version != bytes([MSGPACK_FORMAT_VERSION]):
+            raise ValueError(f"Unsupported document file version {version!r} in {file_path}")
+        strings = []
+        for new_strings, page_content, metadata, refs in msgpack.Unpacker(f, raw=False):
+            strings.extend(new_strings)
+            for key in refs:
+                metadata[key] = strings[metadata[key]]
+            if isinstance(metadata, list):
+                metadata = dict(zip(METADATA_FIELDS, metadata))
+            yield Document(page_content=page_content, metadata=metadata)
+
+def read_documents_pickle(file_path):
+    """
+    Unpickle a saved document list straight from a read-only mmap, skipping buffered file reads.
+
+    Args:
+        file_path (str): Path to the saved .pkl file
+
+    Returns:
+        List[Document]: List of LangChain Document objects
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)
+        except (OSError, ValueError):
+            # mmap can fail on some platforms/filesystems; fall back to a plain read
+            f.seek(0)
+            return pickle.load(f)
+
+def load_documents(file_path):
+    """
+    Load every document from a saved .msgpack.zst or .pkl file.
+
+    Args:
+        file_path (str): Path to the saved file
+
+    Returns:
+        List[Document]: List of LangChain Document objects
+    """
+    if file_path.endswith('.msgpack.zst'):
+        return list(iter_documents_msgpack(file_path))
+    return read_documents_pickle(file_path)
+
+def resolve_documents_filename(folder_path, basename):
+    """
+    Pick the newest available export of a document set, falling back to the pickle.
+
+    Args:
+        folder_path (str): Folder holding the saved files
+        basename (str): File name without extension, e.g. '<prefix>_chunked_docs'
+
+    Returns:
+        str: File name of the export to load
+    """
+    for extension in DOC_FILE_EXTENSIONS:
+        filename = basename + extension
+        if os.path.exists(os.path.join(folder_path, filename)):
+            return filename
+    return basename + DOC_FILE_EXTENSIONS[-1]
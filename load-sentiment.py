@@ -3,19 +3,112 @@ Load and chunk documents from the sentiment dataset.
 This script processes the CSV file and prepares the text data for RAG systems.
 """
 
+import numpy as np
 import pandas as pd
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_text_splitters.character import _split_text_with_regex
 from langchain.schema import Document
 import logging
-import pickle
+import json
 import os
-import glob
+import re
+import fnmatch
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from documents_io import write_documents_msgpack, iter_documents_msgpack, load_documents
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CSV columns used to build Documents; publish_date is optional
+DOCUMENT_COLUMNS = ('title', 'text', 'url', 'publish_date')
+CSV_BLOCK_SIZE = 16 << 20  # Bytes of CSV parsed per Arrow record batch
+PARALLEL_SPLIT_MIN_DOCS = 2_000  # Below this, chunk in-process rather than spinning up workers
+STREAM_CHUNK_BATCH = 20_000  # Documents chunked per batch when streaming to disk
+# "langchain" = RecursiveCharacterTextSplitter rules; "semantic" = the Rust semantic-text-splitter
+# package, several times faster but with different chunk boundaries (pip install semantic-text-splitter)
+TEXT_SPLITTER = "langchain"
+
+def _column_values(batch, name):
+    """Return a string column as a Python list, with empty cells as NaN like pd.read_csv."""
+    column = batch.column(name)
+    values = column.to_pylist()
+    if column.null_count:
+        values = [float('nan') if value is None else value for value in values]
+    return values
+
+class DocStore:
+    """
+    Column-wise store of parsed articles. Each field lives in its own list, so scans such as
+    length statistics walk one flat list instead of chasing Document -> dict -> str, and
+    LangChain Documents are only built when the store is iterated.
+    """
+    
+    def __init__(self, source):
+        self.source = source
+        self.page_contents = []
+        self.titles = []
+        self.urls = []
+        self.publish_dates = []
+        self.indices = []
+    
+    def add_batch(self, batch, has_publish_date=True):
+        """
+        Append one Arrow record batch streamed from the CSV.
+        
+        Args:
+            batch (pa.RecordBatch): Rows with string title, text, url and optionally publish_date
+            has_publish_date (bool): Whether the CSV has a publish_date column
+        """
+        # Convert each Arrow column straight to Python strings, skipping a numpy object array
+        titles = _column_values(batch, 'title')
+        texts = _column_values(batch, 'text')
+        urls = _column_values(batch, 'url')
+        
+        # Create document content with title and text; a single f-string (one BUILD_STRING)
+        # in a list comprehension measured faster here than str.join or a generator
+        self.page_contents.extend([
+            f"Title: {title}\n\nText: {text}\n\nURL: {url}" for title, text, url in zip(titles, texts, urls)
+        ])
+        self.titles.extend(titles)
+        self.urls.extend(urls)
+        if has_publish_date:
+            self.publish_dates.extend(_column_values(batch, 'publish_date'))
+        else:
+            self.publish_dates.extend([''] * batch.num_rows)
+        start = len(self.indices)
+        self.indices.extend(range(start, start + batch.num_rows))
+    
+    def __len__(self):
+        return len(self.page_contents)
+    
+    def __iter__(self):
+        return self.to_documents()
+    
+    def to_documents(self):
+        """
+        Lazily build LangChain Documents from the stored columns.
+        
+        Yields:
+            Document: One LangChain Document per stored article
+        """
+        for content, title, url, publish_date, idx in zip(
+            self.page_contents, self.titles, self.urls, self.publish_dates, self.indices
+        ):
+            metadata = {
+                'title': title,
+                'url': url,
+                'publish_date': publish_date,
+                'source': self.source,
+                'index': idx
+            }
+            yield Document(page_content=content, metadata=metadata)
+
 def load_sentiment_data(csv_file_path: str):
     """
     Load sentiment data from CSV file and convert to LangChain Documents.
@@ -24,7 +117,7 @@ def load_sentiment_data(csv_file_path: str):
         csv_file_path (str): Path to the CSV file containing sentiment articles
         
     Returns:
-        List[Document]: List of LangChain Document objects
+        DocStore: Parsed articles; iterate it for LangChain Document objects
     """
     try:
         logger.info(f"Loading sentiment data from {csv_file_path}")
@@ -33,30 +126,27 @@ def load_sentiment_data(csv_file_path: str):
         csv_filename = os.path.basename(csv_file_path)
         filename_prefix = csv_filename.replace('_sentiment_articles_', '_').replace('.csv', '')
         
-        # Read the CSV file
-        df = pd.read_csv(csv_file_path)
-        logger.info(f"Loaded {len(df)} articles from CSV")
-        
-        # Convert to LangChain Documents
-        documents = []
-        for idx, row in df.iterrows():
-            # Create document content with title and text
-            content = f"Title: {row['title']}\n\nText: {row['text']}\n\nURL: {row['url']}"
-            
-            # Create metadata
-            metadata = {
-                'title': row['title'],
-                'url': row['url'],
-                'publish_date': row.get('publish_date', ''),
-                'source': f'{filename_prefix}_sentiment',
-                'index': idx
-            }
-            
-            # Create LangChain Document
-            doc = Document(page_content=content, metadata=metadata)
-            documents.append(doc)
+        # Read only the columns we turn into Documents; scraped CSVs can carry much more
+        available_columns = pd.read_csv(csv_file_path, nrows=0).columns
+        wanted_columns = [col for col in DOCUMENT_COLUMNS if col in available_columns]
         
-        logger.info(f"Created {len(documents)} LangChain Documents")
+        # Stream the CSV through Arrow's multi-threaded parser, one record batch at a time.
+        # Every column stays a string (no date inference) and article text may span lines.
+        reader = pa_csv.open_csv(
+            csv_file_path,
+            read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=wanted_columns,
+                column_types={col: pa.string() for col in wanted_columns},
+                strings_can_be_null=True,
+            ),
+        )
+        documents = DocStore(f'{filename_prefix}_sentiment')
+        has_publish_date = 'publish_date' in wanted_columns
+        for batch in reader:
+            documents.add_batch(batch, has_publish_date)
+        logger.info(f"Loaded {len(documents)} articles from CSV")
         return documents, filename_prefix
         
     except Exception as e:
@@ -72,45 +162,46 @@ def load_sentiment_data_by_fight(fighter1_name: str, fighter2_name: str):
         fighter2_name (str): Name of the second fighter
         
     Returns:
-        List[Document]: List of LangChain Document objects
+        DocStore: Parsed articles; iterate it for LangChain Document objects
     """
     # Create the expected CSV filename with different naming patterns
     fight_name_exact = f"{fighter1_name}_vs_{fighter2_name}"
     fight_name_clean = f"{fighter1_name.lower().replace(' ', '_')}_vs_{fighter2_name.lower().replace(' ', '_')}"
     
-    # Try multiple filename patterns
+    sentiment_dir = "../Data/sentiment_datasets"
+    
+    # Try multiple filename patterns; normcase keeps the filesystem's case rules on Windows
     possible_filenames = [
-        f"{fight_name_exact}_sentiment_articles.csv",
-        f"{fight_name_clean}_sentiment_articles.csv"
+        os.path.normcase(f"{fight_name_exact}_sentiment_articles.csv"),
+        os.path.normcase(f"{fight_name_clean}_sentiment_articles.csv")
+    ]
+    
+    # Also match both naming patterns with timestamp
+    patterns = [
+        f"{fight_name_exact}_sentiment_articles_*.csv",
+        f"{fight_name_clean}_sentiment_articles_*.csv"
     ]
+    pattern_re = re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
     
-    csv_file_path = None
-    for filename in possible_filenames:
-        test_path = f"../Data/sentiment_datasets/{filename}"
-        if os.path.exists(test_path):
-            csv_file_path = test_path
-            break
+    # One directory pass buckets exact names and timestamped files
+    exact_files = {}
+    matching_files = []
+    if os.path.isdir(sentiment_dir):
+        with os.scandir(sentiment_dir) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                if name in possible_filenames:
+                    if entry.is_file():
+                        exact_files[name] = entry.path
+                elif pattern_re.match(name) and entry.is_file():
+                    matching_files.append((entry.path, entry.stat().st_ctime))
     
-    # If exact match not found, look for files with timestamp pattern
+    csv_file_path = next((exact_files[name] for name in possible_filenames if name in exact_files), None)
+    
+    # If exact match not found, use the most recent timestamped file
     if csv_file_path is None:
-        sentiment_dir = "../Data/sentiment_datasets"
-        
-        # Try both naming patterns with timestamp
-        patterns = [
-            f"{fight_name_exact}_sentiment_articles_*.csv",
-            f"{fight_name_clean}_sentiment_articles_*.csv"
-        ]
-        
-        matching_files = []
-        for pattern in patterns:
-            # Use forward slashes for glob patterns on Windows
-            full_pattern = sentiment_dir.replace('\\', '/') + '/' + pattern
-            files = glob.glob(full_pattern)
-            matching_files.extend(files)
-        
         if matching_files:
-            # Use the most recent file
-            latest_file = max(matching_files, key=os.path.getctime)
+            latest_file = max(matching_files, key=lambda f: f[1])[0]
             csv_file_path = latest_file
         else:
             logger.error(f"No sentiment data files found for {fight_name_exact} or {fight_name_clean}")
@@ -122,7 +213,127 @@ def load_sentiment_data_by_fight(fighter1_name: str, fighter2_name: str):
         logger.error(f"Error loading sentiment data for {fight_name_exact}: {e}")
         return None, None
 
-def chunk_documents(documents, chunk_size=1000, chunk_overlap=200):
+class BatchLengthTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter that measures each recursion level's splits in one batched
+    call, then reuses those lengths for both the size check and the merge instead of
+    re-measuring each piece. This keeps a future tokenizer-based length function from being
+    called per substring.
+    """
+    
+    def __init__(self, batch_length_function=None, **kwargs):
+        super().__init__(**kwargs)
+        self._batch_length_function = batch_length_function or (lambda splits: list(map(self._length_function, splits)))
+    
+    def _split_text(self, text, separators):
+        # Same recursion as RecursiveCharacterTextSplitter._split_text, but each level's splits
+        # are measured once and those lengths are reused by the merge instead of re-measured
+        separator = separators[-1]
+        new_separators = []
+        for i, s in enumerate(separators):
+            pattern = s if self._is_separator_regex else re.escape(s)
+            if s == "":
+                separator = s
+                break
+            if re.search(pattern, text):
+                separator = s
+                new_separators = separators[i + 1:]
+                break
+        
+        pattern = separator if self._is_separator_regex else re.escape(separator)
+        splits = _split_text_with_regex(text, pattern, keep_separator=self._keep_separator)
+        lengths = self._batch_length_function(splits)
+        
+        final_chunks = []
+        good_splits = []
+        good_lengths = []
+        merge_separator = "" if self._keep_separator else separator
+        for s, length in zip(splits, lengths):
+            if length < self._chunk_size:
+                good_splits.append(s)
+                good_lengths.append(length)
+                continue
+            if good_splits:
+                final_chunks.extend(self._merge_measured_splits(good_splits, good_lengths, merge_separator))
+                good_splits = []
+                good_lengths = []
+            if new_separators:
+                final_chunks.extend(self._split_text(s, new_separators))
+            else:
+                final_chunks.append(s)
+        if good_splits:
+            final_chunks.extend(self._merge_measured_splits(good_splits, good_lengths, merge_separator))
+        return final_chunks
+    
+    def _merge_splits(self, splits, separator):
+        splits = list(splits)
+        return self._merge_measured_splits(splits, self._batch_length_function(splits), separator)
+    
+    def _merge_measured_splits(self, splits, lengths, separator):
+        # Same greedy merge as TextSplitter._merge_splits; the current chunk is splits[start:end]
+        separator_len = self._length_function(separator)
+        docs = []
+        start = 0
+        total = 0
+        for end, length in enumerate(lengths):
+            if total + length + (separator_len if end > start else 0) > self._chunk_size:
+                if total > self._chunk_size:
+                    logger.warning(f"Created a chunk of size {total}, which is longer than the specified {self._chunk_size}")
+                if end > start:
+                    doc = self._join_docs(splits[start:end], separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    # Drop leading splits until we're within the overlap and the next split fits
+                    while total > self._chunk_overlap or (
+                        total + length + (separator_len if end > start else 0) > self._chunk_size
+                        and total > 0
+                    ):
+                        total -= lengths[start] + (separator_len if end - start > 1 else 0)
+                        start += 1
+            total += length + (separator_len if end > start else 0)
+        doc = self._join_docs(splits[start:], separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+@lru_cache(maxsize=8)
+def _make_splitter(chunk_size, chunk_overlap, text_splitter):
+    """Build (once per process and settings) the read-only splitter used by _split_shard."""
+    if text_splitter == "semantic":
+        from semantic_text_splitter import TextSplitter
+        return TextSplitter(capacity=chunk_size, overlap=chunk_overlap)
+    if text_splitter == "langchain":
+        return BatchLengthTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+        )
+    raise ValueError(f"Unknown text splitter {text_splitter!r}; use 'langchain' or 'semantic'")
+
+def _split_shard(documents, chunk_size, chunk_overlap, text_splitter=TEXT_SPLITTER):
+    """
+    Split one shard of documents; module-level so ProcessPoolExecutor workers can pickle it.
+    
+    Args:
+        documents (List[Document]): Shard of LangChain Document objects
+        chunk_size (int): Size of each chunk in characters
+        chunk_overlap (int): Overlap between chunks in characters
+        text_splitter (str): "langchain" or "semantic", see TEXT_SPLITTER
+        
+    Returns:
+        List[Document]: List of chunked Document objects
+    """
+    splitter = _make_splitter(chunk_size, chunk_overlap, text_splitter)
+    if text_splitter == "semantic":
+        # Chunks share their parent's metadata dict rather than each taking a deep copy
+        return [
+            Document(page_content=piece, metadata=doc.metadata)
+            for doc in documents
+            for piece in splitter.chunks(doc.page_content)
+        ]
+    return splitter.split_documents(documents)
+
+def chunk_documents(documents, chunk_size=1000, chunk_overlap=200, text_splitter=TEXT_SPLITTER):
     """
     Split documents into smaller chunks for better processing.
     
@@ -130,6 +341,7 @@ def chunk_documents(documents, chunk_size=1000, chunk_overlap=200):
         documents (List[Document]): List of LangChain Document objects
         chunk_size (int): Size of each chunk in characters
         chunk_overlap (int): Overlap between chunks in characters
+        text_splitter (str): "langchain" or "semantic", see TEXT_SPLITTER
         
     Returns:
         List[Document]: List of chunked Document objects
@@ -137,15 +349,24 @@ def chunk_documents(documents, chunk_size=1000, chunk_overlap=200):
     try:
         logger.info("Chunking documents...")
         
-        # Create text splitter
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-        )
+        # Accept any iterable (e.g. a DocStore); sharding below needs len() and slicing
+        if not isinstance(documents, list):
+            documents = list(documents)
         
-        # Split documents into chunks
-        chunked_docs = text_splitter.split_documents(documents)
+        # Fail here rather than inside every pool worker
+        _make_splitter(chunk_size, chunk_overlap, text_splitter)
+        
+        workers = os.cpu_count() or 1
+        if workers == 1 or len(documents) < PARALLEL_SPLIT_MIN_DOCS:
+            # Process startup would cost more than it saves on small inputs
+            chunked_docs = _split_shard(documents, chunk_size, chunk_overlap, text_splitter)
+        else:
+            # Splitting is GIL-bound string work, so fan contiguous shards out to processes
+            shard_size = -(-len(documents) // workers)
+            shards = [documents[i:i + shard_size] for i in range(0, len(documents), shard_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_split_shard, shards, repeat(chunk_size), repeat(chunk_overlap), repeat(text_splitter))
+                chunked_docs = list(chain.from_iterable(results))
         
         logger.info(f"Split {len(documents)} documents into {len(chunked_docs)} chunks")
         return chunked_docs
@@ -154,45 +375,107 @@ def chunk_documents(documents, chunk_size=1000, chunk_overlap=200):
         logger.error(f"Error chunking documents: {e}")
         raise
 
-def save_langchain_documents(documents, filename_prefix, output_folder="Data"):
+def iter_chunked_documents(documents, chunk_size=1000, chunk_overlap=200, batch_size=None, text_splitter=TEXT_SPLITTER):
+    """
+    Lazily chunk a stream of documents, holding at most one batch of inputs and its chunks.
+    
+    Args:
+        documents (Iterable[Document]): LangChain Document objects
+        chunk_size (int): Size of each chunk in characters
+        chunk_overlap (int): Overlap between chunks in characters
+        batch_size (int): Documents handed to chunk_documents at a time
+        text_splitter (str): "langchain" or "semantic", see TEXT_SPLITTER
+        
+    Yields:
+        Document: Chunked Document objects, in input order
+    """
+    batch_size = batch_size or STREAM_CHUNK_BATCH
+    documents = iter(documents)
+    while batch := list(islice(documents, batch_size)):
+        yield from chunk_documents(batch, chunk_size, chunk_overlap, text_splitter)
+
+def _load_saved_counts(counts_path):
+    """Return the record counts saved alongside a document set, or {} if there are none."""
+    try:
+        with open(counts_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_counts(counts_path, counts):
+    """Atomically write the record counts for a document set."""
+    tmp_path = counts_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(counts, f)
+    os.replace(tmp_path, counts_path)
+
+def _is_up_to_date(path, *sources):
+    """Return True if path exists and is at least as new as every existing source file."""
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    return all(mtime >= os.path.getmtime(src) for src in sources if src and os.path.exists(src))
+
+def save_langchain_documents(documents, filename_prefix, output_folder="Data", source_path=None):
     """
     Save LangChain documents to the specified folder.
     
+    The originals are written first; chunks are then produced from the on-disk copy and
+    streamed straight to the chunked file, so the full chunked list is never held in memory.
+    When source_path is given, files already newer than it (and, for the chunks, newer
+    than the originals) are kept as-is instead of being rewritten; their record counts come
+    from the *_docs_counts.json file written after each completed save.
+    
     Args:
-        documents (List[Document]): List of LangChain Document objects
+        documents (Iterable[Document]): LangChain Document objects (a generator is fine)
         filename_prefix (str): Prefix for the saved files (extracted from CSV filename)
         output_folder (str): Path to the output folder
+        source_path (str): CSV the documents were loaded from, used for the freshness check
     """
     try:
         # Create output folder if it doesn't exist
         os.makedirs(output_folder, exist_ok=True)
         
         # Save original documents with simple naming (no timestamp)
-        original_filename = f"{filename_prefix}_original_docs.pkl"
+        original_filename = f"{filename_prefix}_original_docs.msgpack.zst"
         original_path = os.path.join(output_folder, original_filename)
         
-        with open(original_path, 'wb') as f:
-            pickle.dump(documents, f)
+        # Record counts are kept beside the files so skipped steps don't re-read them
+        counts_path = os.path.join(output_folder, f"{filename_prefix}_docs_counts.json")
+        counts = _load_saved_counts(counts_path)
         
-        logger.info(f"Saved {len(documents)} original documents to {original_path}")
+        if source_path and 'original_count' in counts and _is_up_to_date(original_path, source_path):
+            original_count = counts['original_count']
+            logger.info(f"Original documents up to date, skipping {original_path}")
+        else:
+            original_count = write_documents_msgpack(documents, original_path)
+            # Any saved chunk count belongs to the replaced originals
+            counts = {'original_count': original_count}
+            _save_counts(counts_path, counts)
+            logger.info(f"Saved {original_count} original documents to {original_path}")
         
         # Save chunked documents with simple naming (no timestamp)
-        chunked_filename = f"{filename_prefix}_chunked_docs.pkl"
+        chunked_filename = f"{filename_prefix}_chunked_docs.msgpack.zst"
         chunked_path = os.path.join(output_folder, chunked_filename)
         
-        # First chunk the documents
-        chunked_docs = chunk_documents(documents)
-        
-        with open(chunked_path, 'wb') as f:
-            pickle.dump(chunked_docs, f)
-        
-        logger.info(f"Saved {len(chunked_docs)} chunked documents to {chunked_path}")
+        # Chunks made by the other splitter have different boundaries, so they count as stale
+        chunks_current = 'chunked_count' in counts and counts.get('text_splitter') == TEXT_SPLITTER
+        if source_path and chunks_current and _is_up_to_date(chunked_path, original_path, source_path):
+            chunked_count = counts['chunked_count']
+            logger.info(f"Chunked file up to date, skipping chunking for {chunked_path}")
+        else:
+            # Chunk from the saved originals, one batch at a time
+            chunked_docs = iter_chunked_documents(iter_documents_msgpack(original_path), text_splitter=TEXT_SPLITTER)
+            chunked_count = write_documents_msgpack(chunked_docs, chunked_path)
+            counts.update(chunked_count=chunked_count, text_splitter=TEXT_SPLITTER)
+            _save_counts(counts_path, counts)
+            logger.info(f"Saved {chunked_count} chunked documents to {chunked_path}")
         
         return {
             'original_path': original_path,
             'chunked_path': chunked_path,
-            'original_count': len(documents),
-            'chunked_count': len(chunked_docs)
+            'original_count': original_count,
+            'chunked_count': chunked_count
         }
         
     except Exception as e:
@@ -201,17 +484,16 @@ def save_langchain_documents(documents, filename_prefix, output_folder="Data"):
 
 def load_langchain_documents(file_path):
     """
-    Load LangChain documents from a saved pickle file.
+    Load LangChain documents from a saved msgpack file (or one of the committed pickles).
     
     Args:
-        file_path (str): Path to the saved pickle file
+        file_path (str): Path to the saved .msgpack.zst or .pkl file
         
     Returns:
         List[Document]: List of LangChain Document objects
     """
     try:
-        with open(file_path, 'rb') as f:
-            documents = pickle.load(f)
+        documents = load_documents(file_path)
         
         logger.info(f"Loaded {len(documents)} documents from {file_path}")
         return documents
@@ -225,17 +507,21 @@ def analyze_sentiment_data(documents):
     Analyze the sentiment data to provide insights.
     
     Args:
-        documents (List[Document]): List of LangChain Document objects
+        documents (DocStore | List[Document]): Parsed articles or LangChain Document objects
     """
     logger.info("Analyzing sentiment data...")
     
-    # Basic statistics
-    total_articles = len(documents)
-    total_text_length = sum(len(doc.page_content) for doc in documents)
-    avg_text_length = total_text_length / total_articles if total_articles > 0 else 0
+    if isinstance(documents, DocStore):
+        page_contents = documents.page_contents
+        titles = documents.titles
+    else:
+        page_contents = [doc.page_content for doc in documents]
+        titles = [doc.metadata.get('title', '') for doc in documents]
     
-    # Extract titles for analysis
-    titles = [doc.metadata.get('title', '') for doc in documents]
+    # Basic statistics
+    total_articles = len(page_contents)
+    text_lengths = np.fromiter(map(len, page_contents), dtype=np.int64, count=total_articles)
+    avg_text_length = float(text_lengths.mean()) if total_articles > 0 else 0
     
     print(f"\n=== Sentiment Data Analysis ===")
     print(f"Total articles: {total_articles}")
@@ -274,7 +560,7 @@ def main():
 
         # Save the processed documents to langchain_documents folder
         print("\nSaving LangChain documents...")
-        saved_files = save_langchain_documents(documents, filename_prefix)
+        saved_files = save_langchain_documents(documents, filename_prefix, source_path=csv_file_path)
 
         print(f"\n=== Processing Complete ===")
         print(f"Original documents: {saved_files['original_count']}")